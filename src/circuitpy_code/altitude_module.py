@@ -1,23 +1,105 @@
+import math
+import time
 import adafruit_bmp280
 
-def celsius_to_fahrenheit(temp_c):
-    temp_f = temp_c * (9/5) + 32
-    return int(temp_f)
+# BMP280 data registers: press_msb/lsb/xlsb (0xF7-0xF9) then temp_msb/lsb/xlsb (0xFA-0xFC)
+_REGISTER_DATA = 0xF7
 
 class AltitudeSensor:
-    def __init__(self, i2c):
+    def __init__(self, i2c, max_age=0.5):
+        """Initialize the BMP280 altitude sensor.
+
+        Args:
+            i2c: Existing I2C bus to use
+            max_age: Seconds a reading is reused before the sensor is read again
+        """
         # set up altitude sensor
         self.bmp_sensor = adafruit_bmp280.Adafruit_BMP280_I2C(i2c)
         self.bmp_sensor.sea_level_pressure = 1013.9 # sd sea level pressure
+        self.max_age = max_age
+
+        # Preallocated buffers for the burst read
+        self._reg = bytearray((_REGISTER_DATA,))
+        self._buf = bytearray(6)
+
+        # Cached readings, refreshed by read_all()
+        self._last_read = None
+        self._raw_temp = 0
+        self._raw_press = 0
+        self._t_fine = 0
+        self._altitude = 0
+        self._temp_f = 0
+        self._press_hpa = 0
+
+    def _refresh(self):
+        """Read the sensor again unless the cached readings are still fresh"""
+        if self._last_read is None or time.monotonic() - self._last_read >= self.max_age:
+            self.read_all()
+
+    def read_all(self):
+        """Read pressure and temperature in one I2C burst and update all cached readings
+
+        Returns:
+            (altitude_m, temperature_f, pressure_hpa) as ints
+        """
+        sensor = self.bmp_sensor
+        if sensor.mode != adafruit_bmp280.MODE_NORMAL:
+            # Trigger one forced measurement and wait for the conversion
+            sensor.mode = adafruit_bmp280.MODE_FORCE
+            while sensor._get_status() & 0x08:
+                time.sleep(0.002)
+
+        # One transaction grabs all six data bytes
+        with sensor._i2c as i2c:
+            i2c.write_then_readinto(self._reg, self._buf)
+        buf = self._buf
+        self._raw_press = ((buf[0] << 16) | (buf[1] << 8) | buf[2]) >> 4
+        self._raw_temp = ((buf[3] << 16) | (buf[4] << 8) | buf[5]) >> 4
+
+        # Temperature compensation (same math as adafruit_bmp280)
+        t_calib = sensor._temp_calib
+        adc_t = float(self._raw_temp)
+        var1 = (adc_t / 16384.0 - t_calib[0] / 1024.0) * t_calib[1]
+        var2 = adc_t / 131072.0 - t_calib[0] / 8192.0
+        var2 = var2 * var2 * t_calib[2]
+        self._t_fine = int(var1 + var2)
+        # Fahrenheit straight from t_fine: celsius is t_fine / 5120, so
+        # (9*c + 160) / 5  ==  (9*t_fine + 819200) / 25600 - one divide
+        self._temp_f = int((9 * self._t_fine + 819200) / 25600)
+
+        # Pressure compensation, reusing t_fine from the same frame
+        p_calib = sensor._pressure_calib
+        var1 = float(self._t_fine) / 2.0 - 64000.0
+        var2 = var1 * var1 * p_calib[5] / 32768.0
+        var2 += var1 * p_calib[4] * 2.0
+        var2 = var2 / 4.0 + p_calib[3] * 65536.0
+        var3 = p_calib[2] * var1 * var1 / 524288.0
+        var1 = (var3 + p_calib[1] * var1) / 524288.0
+        var1 = (1.0 + var1 / 32768.0) * p_calib[0]
+        if var1:
+            pressure = 1048576.0 - self._raw_press
+            pressure = ((pressure - var2 / 4096.0) * 6250.0) / var1
+            var1 = p_calib[8] * pressure * pressure / 2147483648.0
+            var2 = pressure * p_calib[7] / 32768.0
+            pressure += (var1 + var2 + p_calib[6]) / 16.0
+            pressure /= 100
+            self._press_hpa = pressure
+            self._altitude = 44330 * (1.0 - math.pow(pressure / sensor.sea_level_pressure, 0.1903))
+
+        self._last_read = time.monotonic()
+        return int(self._altitude), self._temp_f, int(self._press_hpa)
 
     def get_altitude(self):
         #return altitude in meters
-        return int(self.bmp_sensor.altitude)
+        self._refresh()
+        return int(self._altitude)
 
     def get_temperature(self):
         #return temperature in fahrenheit
-        return celsius_to_fahrenheit(self.bmp_sensor.temperature)
-    
+        self._refresh()
+        return self._temp_f
+
     def get_pressure(self):
         #return pressure hPa
-        return int(self.bmp_sensor.pressure)
\ No newline at end of file
+        self._refresh()
+        return int(self._press_hpa)
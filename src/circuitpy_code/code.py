@@ -5,21 +5,64 @@ import neopixel
 import time
 import busio
 import analogio
+import asyncio
+from micropython import const
 from gps_module import GPSModule
 from simple_oled import SimpleOLED  
-from altitude_module import AltitudeSensor, celsius_to_fahrenheit
-from rockblock_module import SimpleRockBLOCK
+from altitude_module import AltitudeSensor
 
 # ===========================================
 # CONFIGURATION
 # ===========================================
 SATELLITE_ENABLED = True
-SATELLITE_INTERVAL_SECONDS = 300  # 5 minutes
+SATELLITE_INTERVAL_SECONDS = const(300)  # 5 minutes - ascent / default
+NEAR_BURST_INTERVAL_SECONDS = const(60)   # above NEAR_BURST_ALTITUDE_M
+DESCENT_INTERVAL_SECONDS = const(120)     # falling faster than DESCENT_RATE_M between messages
+LANDED_INTERVAL_SECONDS = const(30)       # back below LANDED_ALTITUDE_M after flying - aids recovery
+NEAR_BURST_ALTITUDE_M = const(30000)
+DESCENT_RATE_M = const(50)
+LANDED_ALTITUDE_M = const(1000)
 REQUIRE_GPS_FOR_SATELLITE = True
-MIN_SIGNAL_STRENGTH = 0  # 0 = disabled, 1-5 = minimum required
-RETRY_FAILED_AFTER_SECONDS = 30
+MIN_SIGNAL_STRENGTH = const(0)  # 0 = disabled, 1-5 = minimum required
+RETRY_FAILED_AFTER_SECONDS = const(30)
+I2C_FREQUENCY = const(400_000)  # BMP280, GPS and OLED all support fast-mode
+
+# Task intervals (seconds)
+GPS_INTERVAL_SECONDS = 0.1  # update() only reads what the module has buffered (one 32-byte read when idle)
+BMP_INTERVAL_SECONDS = const(5)
+DISPLAY_INTERVAL_SECONDS = const(2)
+STATUS_INTERVAL_SECONDS = const(10)
+LED_INTERVAL_SECONDS = const(1)
+SATELLITE_POLL_SECONDS = 0.1  # How often to check the modem while a send is in progress
+URC_POLL_SECONDS = const(2)   # How often to read the modem's +CIEV reports between sends
 # ===========================================
 
+# Raw 16-bit ADC reading to volts (3.3 V reference)
+_V_SCALE = 3.3 / 65535.0
+
+class SensorData:
+    """Latest sensor readings - one object reused for the whole flight"""
+    __slots__ = (
+        'lat', 'lon', 'altitude', 'satellites', 'battery', 'temperature',
+        'has_gps_fix', 'lat_str', 'lon_str', 'alt_str', 'temp_str', 'batt_str'
+    )
+    
+    def __init__(self):
+        self.lat = None
+        self.lon = None
+        self.altitude = None
+        self.satellites = 0
+        self.battery = None
+        self.temperature = None
+        self.has_gps_fix = False
+        
+        # Display strings, only re-formatted when the value changes
+        self.lat_str = None
+        self.lon_str = None
+        self.alt_str = "N/Am"
+        self.temp_str = "N/A°F"
+        self.batt_str = None
+
 class HABTracker:
     def __init__(self):
         # Status tracking
@@ -27,43 +70,100 @@ class HABTracker:
         self.satellite_fail_count = 0
         self.next_satellite_time = 0  # Send immediately on startup
         
+        # Flight phase tracking for the adaptive satellite interval
+        self._prev_altitude = None
+        self._has_flown = False
+        
+        # Latest sensor readings, updated in place by the tasks
+        self.data = SensorData()
+        
+        # What the OLED currently shows, so an identical frame isn't pushed again
+        self._last_oled_key = None
+        # Regular screens wait until a held status message has been up long enough
+        self._oled_hold_until = 0
+        
+        # Screens cycled by the display task - each returns the lines to show
+        self._screens = (
+            self._temperature_screen,
+            self._altitude_screen,
+            self._gps_screen,
+            self._battery_screen,
+            self._satellite_screen,
+        )
+        
         # Initialize hardware
-        self.led = digitalio.DigitalInOut(board.LED)
-        self.led.direction = digitalio.Direction.OUTPUT
+        # Heartbeat LED - blinked by PWM hardware if the board can go that slow,
+        # otherwise toggled by _led_task
+        self.led = None
+        try:
+            import pwmio
+            self.heartbeat = pwmio.PWMOut(board.LED, frequency=1, duty_cycle=32768)
+        except (ImportError, ValueError, RuntimeError):
+            self.heartbeat = None
+            self.led = digitalio.DigitalInOut(board.LED)
+            self.led.direction = digitalio.Direction.OUTPUT
         self.pixels = neopixel.NeoPixel(board.NEOPIXEL, 1)
+        self._led_color = None
         
         # Initialize all components
         self._initialize_hardware()
     
-    def _show_boot_status(self, message, line2=""):
-        """Display boot status on OLED and serial"""
+    def _show_boot_status(self, message, line2="", hold=0.5):
+        """Display boot status on OLED and serial
+        
+        Args:
+            message: First status line
+            line2: Optional second line
+            hold: Seconds to leave the message on the OLED (skipped without an OLED)
+        """
         print(message)
         if line2:
             print(line2)
         
         if hasattr(self, 'oled') and self.oled:
-            try:
-                self.oled.clear()
-                self.oled.add_text("HAB Tracker")
-                self.oled.add_text(message)
-                if line2:
-                    self.oled.add_text(line2)
-            except:
-                pass
-        time.sleep(2)
+            self._oled_status("HAB Tracker", message, line2)
+            # Nothing else is running yet, so booting can simply wait
+            if hold:
+                time.sleep(hold)
+    
+    def _oled_status(self, line1, line2="", line3="", hold=0):
+        """Show a status message on the OLED as one frame
+        
+        Args:
+            line1: First line
+            line2: Optional second line
+            line3: Optional third line
+            hold: Seconds the display task leaves the message up before the next screen
+        """
+        if not self.oled:
+            return
+        
+        # The next regular screen has to be redrawn over this
+        self._last_oled_key = None
+        self._oled_hold_until = time.monotonic() + hold
+        try:
+            self.oled.set_lines([line for line in (line1, line2, line3) if line])
+        except:
+            pass
     
     def _initialize_hardware(self):
         """Initialize all hardware components"""
+        # Shared I2C bus - run at fast-mode (400 kHz) instead of the 100 kHz default,
+        # falling back to the board's standard bus if that can't be set up
+        try:
+            self.i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
+        except (ValueError, RuntimeError):
+            self.i2c = board.I2C()
+        
         # OLED Display
         try:
-            self.oled = SimpleOLED()
+            self.oled = SimpleOLED(i2c=self.i2c)
             self.oled.add_text("HAB Tracker")
             self.oled.add_text("Booting...")
         except:
             self.oled = None
         
         self._show_boot_status("Init sensors...")
-        self.i2c = board.I2C()
         
         # Battery monitoring
         try:
@@ -89,220 +189,352 @@ class HABTracker:
             self.gps = None
             self._show_boot_status("GPS: FAIL")
         
-        # Satellite Modem (RockBLOCK) - Required!
+        # Satellite Modem (RockBLOCK) - Required when satellite is enabled!
+        self.rockblock = None
+        if not SATELLITE_ENABLED:
+            self._show_boot_status("Ready!")
+            return
         try:
-            time.sleep(3)
+            # Only load the modem driver when it will be used
+            from rockblock_module import SimpleRockBLOCK
             self.rockblock = SimpleRockBLOCK(debug=True)
             
             if not self.rockblock.model:
-                self._show_boot_status("RockBLOCK: FAIL", "Check power!")
+                self._show_boot_status("RockBLOCK: FAIL", "Check power!", hold=2.0)
                 while True:
                     time.sleep(10)
             
             imei_short = self.rockblock.serial_number[-6:] if self.rockblock.serial_number else 'Unknown'
             self._show_boot_status("RockBLOCK: OK", f"IMEI: {imei_short}")
         except Exception as e:
-            self._show_boot_status("RockBLOCK: FAIL", "Check wiring!")
+            self._show_boot_status("RockBLOCK: FAIL", "Check wiring!", hold=2.0)
             while True:
                 time.sleep(10)
         
         self._show_boot_status("Ready!")
-        time.sleep(1)
     
     def get_battery_voltage(self):
         """Read battery voltage"""
         if not self.battery_voltage:
             return None
         try:
-            return (self.battery_voltage.value / 65535.0) * 3.3
+            # Average 8 raw readings to cut ADC noise - integer sum, shift to divide
+            adc = self.battery_voltage
+            acc = 0
+            for _ in range(8):
+                acc += adc.value
+            return (acc >> 3) * _V_SCALE
         except:
             return None
     
-    def collect_data(self):
-        """Collect all sensor readings"""
-        data = {
-            'lat': None, 'lon': None, 'altitude': None,
-            'satellites': 0, 'battery': None, 'temperature': None,
-            'has_gps_fix': False
-        }
-        
-        # GPS data
-        if self.gps:
-            self.gps.update()
-            data['has_gps_fix'] = self.gps.has_fix
-            data['satellites'] = self.gps.get_satellites()
-            if self.gps.has_fix:
-                location = self.gps.get_location()
-                if location:
-                    data['lat'], data['lon'] = location
+    def _update_gps(self):
+        """Poll the GPS and update the location fields"""
+        data = self.data
+        gps = self.gps
+        if not gps:
+            return
+        
+        # Nothing to do until a sentence has actually changed the fix data
+        gps.update()
+        if not gps.pending_fix:
+            return
+        gps.pending_fix = False
+        
+        has_fix = gps.has_fix
+        data.has_gps_fix = has_fix
+        data.satellites = gps.get_satellites()
+        lat, lon = None, None
+        if has_fix:
+            location = gps.get_location()
+            if location:
+                lat, lon = location
+        
+        if lat != data.lat:
+            data.lat = lat
+            data.lat_str = "%.4f" % lat if lat is not None else None
+        if lon != data.lon:
+            data.lon = lon
+            data.lon_str = "%.4f" % lon if lon is not None else None
+    
+    def _refresh_bmp(self):
+        """Read altitude, temperature and battery"""
+        data = self.data
         
         # Altitude and temperature
         if self.bmp_sensor:
-            data['altitude'] = self.bmp_sensor.get_altitude()
-            data['temperature'] = self.bmp_sensor.get_temperature()
+            # One sensor read for both values
+            altitude, temperature, _ = self.bmp_sensor.read_all()
+            if altitude != data.altitude:
+                data.altitude = altitude
+                data.alt_str = "%sm" % (altitude or 'N/A')
+            if temperature != data.temperature:
+                data.temperature = temperature
+                data.temp_str = "%s°F" % (temperature or 'N/A')
         
         # Battery
-        data['battery'] = self.get_battery_voltage()
-        
-        return data
+        battery = self.get_battery_voltage()
+        if battery != data.battery:
+            data.battery = battery
+            data.batt_str = "%.2fV" % battery if battery else None
     
-    def try_send_satellite(self, data):
-        """Try to send satellite message"""
+    async def try_send_satellite(self, data):
+        """Start sending a satellite message - the satellite task polls it to completion
+        
+        Returns:
+            True if a send was started
+        """
         if not SATELLITE_ENABLED:
             return False
             
         # Check GPS requirement
-        if REQUIRE_GPS_FOR_SATELLITE and not data['has_gps_fix']:
+        if REQUIRE_GPS_FOR_SATELLITE and not data.has_gps_fix:
             print("📡 Waiting for GPS lock to send...")
             # Check again in 30 seconds
-            self.next_satellite_time = time.time() + 30
+            self.next_satellite_time = time.monotonic() + 30
             return False
         
-        # Check signal strength
-        signal = self.rockblock.check_signal()
+        # Check signal strength - waits for a +CSQ answer without blocking the other tasks
+        rockblock = self.rockblock
+        signal = rockblock.start_signal_check()
+        while signal is None:
+            await asyncio.sleep(SATELLITE_POLL_SECONDS)
+            signal = rockblock.poll_signal()
         print(f"📡 Signal: {signal}/5")
         
         if signal < MIN_SIGNAL_STRENGTH:
             print(f"❌ Signal too weak - need {MIN_SIGNAL_STRENGTH}/5")
             return False
         
+        # The modem reports loss of Iridium service with +CIEV:1,0
+        if rockblock.network_available is False:
+            print("❌ No Iridium service")
+            return False
+        
         # Show transmitting message
-        if self.oled:
-            self.oled.clear()
-            self.oled.add_text("TRANSMITTING")
-            self.oled.add_text(f"{data['lat']:.2f},{data['lon']:.2f}")
-            self.oled.add_text(f"{data['altitude'] or 0}m")
-        
-        # Send the message
-        print(f"📡 Sending: {data['lat']:.4f},{data['lon']:.4f} alt:{data['altitude']}m")
-        success, _ = self.rockblock.send_tracking_data_with_retry(
-            data['lat'], data['lon'], data['altitude'], 
-            data['satellites'], data['battery'], data['temperature'], 
+        self._oled_status("TRANSMITTING", data.lat_str + "," + data.lon_str, data.alt_str)
+        
+        # Start the send - returns straight away, the satellite task calls poll()
+        print(f"📡 Sending: {data.lat_str},{data.lon_str} alt:{data.alt_str}")
+        return rockblock.start_tracking_data(
+            data.lat, data.lon, data.altitude, 
+            data.satellites, data.battery, data.temperature, 
             max_attempts=2
         )
+    
+    def _satellite_interval(self, altitude):
+        """Seconds until the next message, based on the flight phase
+        
+        Spends the same message budget where the position changes fastest:
+        near burst, on the way down and after landing.
+        
+        Args:
+            altitude: Flight altitude in meters (see _flight_altitude)
+        """
+        alt = altitude or 0
+        prev_alt = self._prev_altitude if self._prev_altitude is not None else alt
+        self._prev_altitude = alt
+        if alt > LANDED_ALTITUDE_M:
+            self._has_flown = True
         
-        return success
+        if alt < LANDED_ALTITUDE_M and self._has_flown:
+            return LANDED_INTERVAL_SECONDS     # Landed / recovery
+        if alt - prev_alt < -DESCENT_RATE_M:
+            return DESCENT_INTERVAL_SECONDS    # Descent
+        if alt > NEAR_BURST_ALTITUDE_M:
+            return NEAR_BURST_INTERVAL_SECONDS # Near burst
+        return SATELLITE_INTERVAL_SECONDS      # Ascent
+    
+    def _flight_altitude(self):
+        """Altitude for the flight phase - GPS (GGA) with a fix, otherwise the BMP280
+        
+        The BMP280 is only specified down to 300 hPa (about 9 km), so its
+        altitude can't be trusted near burst or early in the descent.
+        """
+        if self.gps and self.data.has_gps_fix:
+            altitude = self.gps.get_altitude()
+            if altitude is not None:
+                return altitude
+        return self.data.altitude
+    
+    def _satellite_result(self, success):
+        """Count a finished send and schedule the next one"""
+        if success:
+            self.satellite_success_count += 1
+            interval = self._satellite_interval(self._flight_altitude())
+            self.next_satellite_time = time.monotonic() + interval
+            print(f"✅ SUCCESS! Total: {self.satellite_success_count}, next in {interval}s")
+            self._oled_status("SENT OK!", f"Total: {self.satellite_success_count}", hold=3)
+        else:
+            self.satellite_fail_count += 1
+            self.next_satellite_time = time.monotonic() + RETRY_FAILED_AFTER_SECONDS
+            print(f"❌ FAILED! Retry in {RETRY_FAILED_AFTER_SECONDS}s")
+            self._oled_status("SEND FAILED", f"Retry in {RETRY_FAILED_AFTER_SECONDS}s", hold=3)
     
     def update_led(self, data):
         """Update status LED color"""
-        if not data['has_gps_fix'] and self.gps:
-            self.pixels.fill((0, 0, 255))    # Blue - GPS searching
-        elif data['has_gps_fix']:
-            self.pixels.fill((0, 255, 0))    # Green - GPS locked
+        has_fix = data.has_gps_fix
+        if has_fix:
+            color = (0, 255, 0)    # Green - GPS locked
+        elif self.gps:
+            color = (0, 0, 255)    # Blue - GPS searching
         else:
-            self.pixels.fill((255, 255, 0))  # Yellow - No GPS
+            color = (255, 255, 0)  # Yellow - No GPS
+        
+        # Only push to the NeoPixel when the colour changes
+        if color != self._led_color:
+            self._led_color = color
+            self.pixels.fill(color)
+    
+    def _temperature_screen(self, data):
+        """Temperature screen lines"""
+        return (data.temp_str, "Temperature")
+    
+    def _altitude_screen(self, data):
+        """Altitude screen lines"""
+        return (data.alt_str, "Altitude")
+    
+    def _gps_screen(self, data):
+        """GPS position screen lines"""
+        if not self.gps:
+            return ("GPS OFFLINE",)
+        if data.has_gps_fix and data.lat and data.lon:
+            return (data.lat_str, data.lon_str, f"Satellites: {data.satellites}")
+        return ("GPS searching...", f"Satellites: {data.satellites}")
+    
+    def _battery_screen(self, data):
+        """Battery screen lines"""
+        if data.battery:
+            return (data.batt_str, "Battery")
+        return ("No battery",)
+    
+    def _satellite_screen(self, data):
+        """Satellite status screen lines"""
+        if self.rockblock is not None and self.rockblock.busy:
+            return ("Transmitting...", f"Sent: {self.satellite_success_count}")
+        if REQUIRE_GPS_FOR_SATELLITE and not data.has_gps_fix:
+            return ("Waiting for GPS", f"Sats: {data.satellites}")
+        return (f"Sent: {self.satellite_success_count}", f"Failed: {self.satellite_fail_count}")
     
     def update_display(self, screen, data):
-        """Update OLED display"""
+        """Update OLED display
+        
+        Args:
+            screen: Index into self._screens
+            data: Latest SensorData
+        """
         if not self.oled:
             return
-            
+        
         try:
-            self.oled.clear()
+            lines = self._screens[screen](data)
             
-            if screen == 0:  # Temperature
-                self.oled.add_text(f"{data['temperature'] or 'N/A'}°F")
-                self.oled.add_text("Temperature")
-                
-            elif screen == 1:  # Altitude  
-                self.oled.add_text(f"{data['altitude'] or 'N/A'}m")
-                self.oled.add_text("Altitude")
-                
-            elif screen == 2:  # GPS
-                if self.gps:
-                    if data['has_gps_fix'] and data['lat'] and data['lon']:
-                        self.oled.add_text(f"{data['lat']:.4f}")
-                        self.oled.add_text(f"{data['lon']:.4f}")
-                        self.oled.add_text(f"Satellites: {data['satellites']}")
-                    else:
-                        self.oled.add_text("GPS searching...")
-                        self.oled.add_text(f"Satellites: {data['satellites']}")
-                else:
-                    self.oled.add_text("GPS OFFLINE")
-                    
-            elif screen == 3:  # Battery
-                if data['battery']:
-                    self.oled.add_text(f"{data['battery']:.2f}V")
-                    self.oled.add_text("Battery")
-                else:
-                    self.oled.add_text("No battery")
-                    
-            elif screen == 4:  # Satellite Status
-                if REQUIRE_GPS_FOR_SATELLITE and not data['has_gps_fix']:
-                    self.oled.add_text("Waiting for GPS")
-                    self.oled.add_text(f"Sats: {data['satellites']}")
-                else:
-                    self.oled.add_text(f"Sent: {self.satellite_success_count}")
-                    self.oled.add_text(f"Failed: {self.satellite_fail_count}")
-                    
+            # Skip the redraw if it would show exactly what is already there
+            if lines == self._last_oled_key:
+                return
+            self._last_oled_key = lines
+            
+            # Let displayio send it in the background while the tasks sleep
+            oled = self.oled
+            oled.begin_frame()
+            try:
+                oled.set_lines(lines)
+            finally:
+                oled.flush_async()
         except:
             pass
     
-    def run(self):
-        """Main loop"""
-        print("\n=== HAB TRACKER STARTED ===")
-        print(f"Satellite: {'ON' if SATELLITE_ENABLED else 'OFF'}")
-        
+    async def _gps_task(self):
+        """Poll the GPS at its own cadence"""
+        while True:
+            self._update_gps()
+            await asyncio.sleep(GPS_INTERVAL_SECONDS)
+    
+    async def _sensor_task(self):
+        """Altitude, temperature and battery"""
+        while True:
+            self._refresh_bmp()
+            await asyncio.sleep(BMP_INTERVAL_SECONDS)
+    
+    async def _status_task(self):
+        """Print a status summary to the serial console"""
+        data = self.data
+        while True:
+            print(f"\n--- Status ---")
+            if self.bmp_sensor:
+                print(f"Temp: {data.temperature}°F, Alt: {data.altitude}m")
+            if data.battery:
+                print(f"Battery: {data.batt_str}")
+            if self.gps:
+                if data.has_gps_fix:
+                    print(f"GPS: ({data.lat}, {data.lon}), Sats: {data.satellites}")
+                else:
+                    print(f"GPS: Searching... Sats: {data.satellites}")
+            await asyncio.sleep(STATUS_INTERVAL_SECONDS)
+    
+    async def _display_task(self):
+        """Cycle the OLED screens and update the status LED"""
+        data = self.data
         counter = 0
-        last_status_time = 0
-        
         while True:
-            # Collect sensor data
-            data = self.collect_data()
-            
-            # Print status every 10 seconds
-            if time.time() - last_status_time >= 10:
-                print(f"\n--- Status ---")
-                if self.bmp_sensor:
-                    print(f"Temp: {data['temperature']}°F, Alt: {data['altitude']}m")
-                if data['battery']:
-                    print(f"Battery: {data['battery']:.2f}V")
-                if self.gps:
-                    if data['has_gps_fix']:
-                        print(f"GPS: ({data['lat']}, {data['lon']}), Sats: {data['satellites']}")
-                    else:
-                        print(f"GPS: Searching... Sats: {data['satellites']}")
-                last_status_time = time.time()
-            
-            # Check if time to send satellite message
-            if SATELLITE_ENABLED and time.time() >= self.next_satellite_time:
+            self.update_led(data)
+            # Leave a held status message (e.g. "SENT OK!") up until it expires
+            if time.monotonic() >= self._oled_hold_until:
+                self.update_display(counter % len(self._screens), data)
+                counter += 1
+            await asyncio.sleep(DISPLAY_INTERVAL_SECONDS)
+    
+    async def _led_task(self):
+        """Heartbeat LED"""
+        led = self.led
+        while True:
+            led.value = not led.value
+            await asyncio.sleep(LED_INTERVAL_SECONDS)
+    
+    async def _satellite_task(self):
+        """Start a send when due, then poll it without blocking the other tasks"""
+        data = self.data
+        rockblock = self.rockblock
+        while True:
+            if rockblock.busy:
+                if rockblock.poll():
+                    success, _ = rockblock.finish()
+                    self._satellite_result(success)
+                else:
+                    await asyncio.sleep(SATELLITE_POLL_SECONDS)
+                    continue
+            elif time.monotonic() >= self.next_satellite_time:
                 print(f"\n📡 Satellite transmission...")
                 
-                success = self.try_send_satellite(data)
-                
-                if success:
-                    self.satellite_success_count += 1
-                    self.next_satellite_time = time.time() + SATELLITE_INTERVAL_SECONDS
-                    print(f"✅ SUCCESS! Total: {self.satellite_success_count}")
-                    
-                    if self.oled:
-                        self.oled.clear()
-                        self.oled.add_text("SENT OK!")
-                        self.oled.add_text(f"Total: {self.satellite_success_count}")
-                        time.sleep(3)
-                elif data['has_gps_fix'] or not REQUIRE_GPS_FOR_SATELLITE:
+                if not await self.try_send_satellite(data):
                     # Only count as failure if we actually tried to send
-                    self.satellite_fail_count += 1
-                    self.next_satellite_time = time.time() + RETRY_FAILED_AFTER_SECONDS
-                    print(f"❌ FAILED! Retry in {RETRY_FAILED_AFTER_SECONDS}s")
-                    
-                    if self.oled:
-                        self.oled.clear()
-                        self.oled.add_text("SEND FAILED")
-                        self.oled.add_text(f"Retry in {RETRY_FAILED_AFTER_SECONDS}s")
-                        time.sleep(3)
-            
-            # Update displays
-            self.update_led(data)
-            self.update_display(counter % 5, data)
-            
-            # Heartbeat LED
-            self.led.value = True
-            time.sleep(1)
-            self.led.value = False
-            time.sleep(1)
+                    if data.has_gps_fix or not REQUIRE_GPS_FOR_SATELLITE:
+                        self._satellite_result(False)
+                continue
             
-            counter += 1
+            # Sleep until the next send is due, waking to pick up +CIEV reports
+            # so they don't pile up in the UART's receive buffer meanwhile
+            rockblock.poll_unsolicited()
+            await asyncio.sleep(min(URC_POLL_SECONDS, max(0.05, self.next_satellite_time - time.monotonic())))
+    
+    async def _main(self):
+        """Run every task side by side"""
+        tasks = [
+            self._gps_task(),
+            self._sensor_task(),
+            self._status_task(),
+            self._display_task(),
+        ]
+        if self.led:
+            tasks.append(self._led_task())
+        if self.rockblock:
+            tasks.append(self._satellite_task())
+        await asyncio.gather(*tasks)
+    
+    def run(self):
+        """Main loop - each task runs at its own cadence under asyncio"""
+        print("\n=== HAB TRACKER STARTED ===")
+        print(f"Satellite: {'ON' if SATELLITE_ENABLED else 'OFF'}")
+        asyncio.run(self._main())
 
 
 # Run the tracker
@@ -4,6 +4,105 @@
 import time
 import adafruit_gps
 
+# NMEA bytes
+_DOLLAR = 0x24
+_STAR = 0x2A
+_COMMA = 0x2C
+_MINUS = 0x2D
+_DOT = 0x2E
+_CR = 0x0D
+_LF = 0x0A
+_A = 0x41
+_S = 0x53
+_W = 0x57
+
+# GGA has the most fields of the sentences we enable (15 including the type)
+_MAX_FIELDS = 20
+
+# NMEA sentences are at most 82 characters including $ and CR LF
+_MAX_SENTENCE = 96
+
+# Bytes asked for per read of the I2C transport, and most reads per update()
+_READ_CHUNK = 32
+_MAX_READS = 8
+
+# print_data() templates
+_SEPARATOR = "=" * 40
+_TIMESTAMP_FMT = "Fix timestamp: {}/{}/{} {:02}:{:02}:{:02}"
+_LAT_FMT = "Latitude: {0:.6f} degrees"
+_LON_FMT = "Longitude: {0:.6f} degrees"
+_PRECISE_LAT_FMT = "Precise Latitude: {} degs, {:2.4f} mins"
+_PRECISE_LON_FMT = "Precise Longitude: {} degs, {:2.4f} mins"
+_FIX_QUALITY_FMT = "Fix quality: {}"
+_SATELLITES_FMT = "# satellites: {}"
+_ALTITUDE_FMT = "Altitude: {} meters"
+_SPEED_KNOTS_FMT = "Speed: {} knots"
+_SPEED_KMH_FMT = "Speed: {} km/h"
+_TRACK_FMT = "Track angle: {} degrees"
+_HDOP_FMT = "Horizontal dilution: {}"
+_GEOID_FMT = "Height geoid: {} meters"
+
+def _hex_digit(char):
+    """Value of one ASCII hex digit, or -1"""
+    if 0x30 <= char <= 0x39:
+        return char - 0x30
+    char |= 0x20  # lower case
+    if 0x61 <= char <= 0x66:
+        return char - 0x57
+    return -1
+
+def _parse_int(buf, start, end):
+    """Parse an unsigned integer from buf[start:end] without slicing. None if empty/invalid."""
+    if start >= end:
+        return None
+    value = 0
+    for i in range(start, end):
+        digit = buf[i] - 0x30
+        if digit < 0 or digit > 9:
+            return None
+        value = value * 10 + digit
+    return value
+
+def _parse_float(buf, start, end):
+    """Parse a decimal like -12.345 from buf[start:end] without slicing. None if empty/invalid."""
+    if start >= end:
+        return None
+    negative = buf[start] == _MINUS
+    if negative:
+        start += 1
+    whole = 0
+    frac = 0
+    scale = 1
+    seen_dot = False
+    for i in range(start, end):
+        char = buf[i]
+        if char == _DOT and not seen_dot:
+            seen_dot = True
+            continue
+        digit = char - 0x30
+        if digit < 0 or digit > 9:
+            return None
+        if seen_dot:
+            frac = frac * 10 + digit
+            scale *= 10
+        else:
+            whole = whole * 10 + digit
+    value = whole + frac / scale
+    return -value if negative else value
+
+def _parse_deg_min(buf, start, end):
+    """Split a ddmm.mmmm / dddmm.mmmm field into (degrees, minutes). None if empty/invalid."""
+    dot = start
+    while dot < end and buf[dot] != _DOT:
+        dot += 1
+    if dot - start < 3:
+        return None
+    degrees = _parse_int(buf, start, dot - 2)
+    minutes = _parse_float(buf, dot - 2, end)
+    if degrees is None or minutes is None:
+        return None
+    return degrees, minutes
+
 class GPSModule:
     def __init__(self, i2c_bus, debug=False, update_rate_ms=1000):
         """Initialize the GPS module.
@@ -15,6 +114,7 @@ class GPSModule:
         """
         # Initialize GPS with the provided I2C bus
         self.gps = adafruit_gps.GPS_GtopI2C(i2c_bus, debug=debug)
+        self.debug = debug
         
         # Initialize the GPS module - Enable GGA and RMC info
         self.gps.send_command(b"PMTK314,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0")
@@ -25,114 +125,336 @@ class GPSModule:
         # Initialize variables
         self.last_update = time.monotonic()
         
-    def update(self):
-        """Update GPS data. Returns True if new data was parsed."""
-        return self.gps.update()
+        # Set when a sentence updates the fix data - callers clear it once they've read it
+        self.pending_fix = False
+        
+        # Sentence being assembled from the bytes read so far, and the last byte
+        # kept (an LF only ends a sentence right after CR - otherwise it's filler)
+        self._line = bytearray(_MAX_SENTENCE)
+        self._line_len = 0
+        self._last_byte = 0
+        
+        # Start/end offset of each field in the sentence being parsed,
+        # preallocated so parsing doesn't build lists of strings
+        self._starts = [0] * _MAX_FIELDS
+        self._ends = [0] * _MAX_FIELDS
+        
+        # Parsed GGA/RMC values
+        self._fix_quality = 0
+        self._satellites = None
+        self._latitude = None
+        self._longitude = None
+        self._latitude_degrees = None
+        self._latitude_minutes = None
+        self._longitude_degrees = None
+        self._longitude_minutes = None
+        self._altitude_m = None
+        self._height_geoid = None
+        self._horizontal_dilution = None
+        self._speed_knots = None
+        self._track_angle_deg = None
+        self._time_hms = None
+        self._date_dmy = (0, 0, 0)
+        
+    def update(self, max_sentences=8):
+        """Update GPS data from the bytes the module has buffered, without waiting
+        for more. Returns True if new data was parsed.
+        
+        GPS_GtopI2C always reports 16 bytes in_waiting and its readline() blocks
+        until a whole sentence arrives, so raw bytes are read instead and the
+        sentences put together here. A partial sentence is kept for next time.
+        
+        Args:
+            max_sentences: Most sentences to parse in one call, so a chatty module can't stall the caller
+        """
+        gps = self.gps
+        line = self._line
+        length = self._line_len
+        last = self._last_byte
+        parsed = False
+        sentences = 0
+        
+        for _ in range(_MAX_READS):
+            chunk = gps.read(_READ_CHUNK)
+            if not chunk:
+                break
+            got_data = False
+            for char in chunk:
+                # The module pads with LF (or the driver with 0) when it has nothing to send
+                if char == 0 or (char == _LF and last != _CR):
+                    continue
+                got_data = True
+                last = char
+                if char == _DOLLAR:
+                    length = 0  # always start over at a new sentence
+                if length < _MAX_SENTENCE:
+                    line[length] = char
+                    length += 1
+                if char == _LF:
+                    if self._parse_sentence(line[:length]):
+                        parsed = True
+                    length = 0
+                    sentences += 1
+            # Only filler - nothing more is buffered
+            if not got_data or sentences >= max_sentences:
+                break
+        
+        self._line_len = length
+        self._last_byte = last
+        if parsed:
+            self.pending_fix = True
+        return parsed
+    
+    def _parse_sentence(self, line):
+        """Parse one NMEA sentence. Returns True if it updated the fix data."""
+        if self.debug:
+            print(line)
+        
+        count = self._split_fields(line)
+        if not count:
+            return False
+        
+        # Sentence type is field 0, e.g. GPGGA / GNRMC - check the last three letters
+        start = self._starts[0]
+        if self._ends[0] - start != 5:
+            return False
+        t0, t1, t2 = line[start + 2], line[start + 3], line[start + 4]
+        if t0 == 0x47 and t1 == 0x47 and t2 == _A:  # GGA
+            return self._parse_gga(line, count)
+        if t0 == 0x52 and t1 == 0x4D and t2 == 0x43:  # RMC
+            return self._parse_rmc(line, count)
+        return False
+    
+    def _split_fields(self, line):
+        """Validate the checksum and record where each comma separated field starts/ends.
+        
+        Returns:
+            Number of fields, or 0 if the sentence is invalid
+        """
+        length = len(line)
+        if length < 8 or line[0] != _DOLLAR:
+            return 0
+        
+        # XOR everything between $ and *
+        checksum = 0
+        star = -1
+        for i in range(1, length):
+            char = line[i]
+            if char == _STAR:
+                star = i
+                break
+            checksum ^= char
+        if star < 0 or star + 2 >= length:
+            return 0
+        high = _hex_digit(line[star + 1])
+        low = _hex_digit(line[star + 2])
+        if high < 0 or low < 0 or (high << 4 | low) != checksum:
+            return 0
+        
+        starts = self._starts
+        ends = self._ends
+        count = 0
+        starts[0] = 1
+        for i in range(1, star):
+            if line[i] == _COMMA:
+                ends[count] = i
+                count += 1
+                if count >= _MAX_FIELDS:
+                    return 0
+                starts[count] = i + 1
+        ends[count] = star
+        return count + 1
+    
+    def _read_time(self, line, index):
+        """Read an hhmmss(.sss) field"""
+        start = self._starts[index]
+        if self._ends[index] - start < 6:
+            return
+        hours = _parse_int(line, start, start + 2)
+        mins = _parse_int(line, start + 2, start + 4)
+        secs = _parse_int(line, start + 4, start + 6)
+        if hours is not None and mins is not None and secs is not None:
+            self._time_hms = (hours, mins, secs)
+    
+    def _read_position(self, line, index):
+        """Read lat, N/S, lon, E/W starting at field index"""
+        starts = self._starts
+        ends = self._ends
+        lat = _parse_deg_min(line, starts[index], ends[index])
+        lon = _parse_deg_min(line, starts[index + 2], ends[index + 2])
+        if lat is None or lon is None:
+            return
+        
+        lat_deg, lat_min = lat
+        lon_deg, lon_min = lon
+        latitude = lat_deg + lat_min / 60
+        longitude = lon_deg + lon_min / 60
+        if line[starts[index + 1]] == _S:
+            latitude = -latitude
+            lat_deg = -lat_deg
+        if line[starts[index + 3]] == _W:
+            longitude = -longitude
+            lon_deg = -lon_deg
+        
+        self._latitude = latitude
+        self._longitude = longitude
+        self._latitude_degrees = lat_deg
+        self._latitude_minutes = lat_min
+        self._longitude_degrees = lon_deg
+        self._longitude_minutes = lon_min
+    
+    def _parse_gga(self, line, count):
+        """GGA - time, position, fix quality, satellites, HDOP, altitude"""
+        if count < 12:
+            return False
+        starts = self._starts
+        ends = self._ends
+        
+        self._read_time(line, 1)
+        self._read_position(line, 2)
+        self._fix_quality = _parse_int(line, starts[6], ends[6]) or 0
+        self._satellites = _parse_int(line, starts[7], ends[7])
+        self._horizontal_dilution = _parse_float(line, starts[8], ends[8])
+        self._altitude_m = _parse_float(line, starts[9], ends[9])
+        self._height_geoid = _parse_float(line, starts[11], ends[11])
+        return True
+    
+    def _parse_rmc(self, line, count):
+        """RMC - time, status, position, speed, track, date"""
+        if count < 12:
+            return False
+        starts = self._starts
+        ends = self._ends
+        
+        self._read_time(line, 1)
+        
+        # Status Valid(A) or Invalid(V) - compare the raw byte, no decode
+        if ends[2] > starts[2] and line[starts[2]] == _A:
+            if self._fix_quality == 0:
+                self._fix_quality = 1
+        else:
+            self._fix_quality = 0
+        
+        self._read_position(line, 3)
+        self._speed_knots = _parse_float(line, starts[7], ends[7])
+        self._track_angle_deg = _parse_float(line, starts[8], ends[8])
+        
+        # Date ddmmyy
+        start = starts[9]
+        if ends[9] - start == 6:
+            day = _parse_int(line, start, start + 2)
+            month = _parse_int(line, start + 2, start + 4)
+            year = _parse_int(line, start + 4, start + 6)
+            if day is not None and month is not None and year is not None:
+                self._date_dmy = (day, month, 2000 + year)
+        return True
+    
+    @property
+    def timestamp_utc(self):
+        """UTC time of the last fix as a time.struct_time, or None"""
+        if self._time_hms is None:
+            return None
+        day, month, year = self._date_dmy
+        hours, mins, secs = self._time_hms
+        return time.struct_time((year, month, day, hours, mins, secs, 0, 0, -1))
     
     def check_fix(self, update_interval=1.0):
-        """Check if GPS has a fix and update.
+        """Update GPS data and check if there's a fix.
+        
+        Sentences are drained on every call so none are missed; only the
+        "Waiting for fix" message is throttled.
         
         Args:
-            update_interval: How often to check for a fix (in seconds)
+            update_interval: How often to print the waiting message (in seconds)
             
         Returns:
             True if there's a valid fix, False otherwise
         """
-        current = time.monotonic()
+        self.update()
+        has_fix = self.has_fix
         
-        # Only check at specified interval
-        if current - self.last_update >= update_interval:
+        current = time.monotonic()
+        if not has_fix and current - self.last_update >= update_interval:
             self.last_update = current
-            
-            # Make sure to update GPS data
-            self.update()
-            
-            if not self.gps.has_fix:
-                print("Waiting for fix...")
-                return False
-                
-            return True
-            
-        return self.gps.has_fix
+            print("Waiting for fix...")
+        return has_fix
     
     def print_data(self):
         """Print all available GPS data."""
-        if not self.gps.has_fix:
+        if not self.has_fix:
             print("No fix available")
             return
-            
-        print("=" * 40)  # Print a separator line
-        
-        # Print timestamp if available
-        if self.gps.timestamp_utc:
-            print(
-                "Fix timestamp: {}/{}/{} {:02}:{:02}:{:02}".format(
-                    self.gps.timestamp_utc.tm_mon,
-                    self.gps.timestamp_utc.tm_mday,
-                    self.gps.timestamp_utc.tm_year,
-                    self.gps.timestamp_utc.tm_hour,
-                    self.gps.timestamp_utc.tm_min,
-                    self.gps.timestamp_utc.tm_sec,
-                )
-            )
-            
+        
+        lines = [_SEPARATOR]
+        
+        # Timestamp if available
+        timestamp = self.timestamp_utc
+        if timestamp:
+            lines.append(_TIMESTAMP_FMT.format(
+                timestamp.tm_mon,
+                timestamp.tm_mday,
+                timestamp.tm_year,
+                timestamp.tm_hour,
+                timestamp.tm_min,
+                timestamp.tm_sec,
+            ))
+        
         # Location data
-        print("Latitude: {0:.6f} degrees".format(self.gps.latitude))
-        print("Longitude: {0:.6f} degrees".format(self.gps.longitude))
-        print(
-            "Precise Latitude: {} degs, {:2.4f} mins".format(
-                self.gps.latitude_degrees, self.gps.latitude_minutes
-            )
-        )
-        print(
-            "Precise Longitude: {} degs, {:2.4f} mins".format(
-                self.gps.longitude_degrees, self.gps.longitude_minutes
-            )
-        )
-        
-        print("Fix quality: {}".format(self.gps.fix_quality))
-        
-        # Print optional attributes if they exist
-        if self.gps.satellites is not None:
-            print("# satellites: {}".format(self.gps.satellites))
-        if self.gps.altitude_m is not None:
-            print("Altitude: {} meters".format(self.gps.altitude_m))
-        if self.gps.speed_knots is not None:
-            print("Speed: {} knots".format(self.gps.speed_knots))
-        if self.gps.speed_kmh is not None:
-            print("Speed: {} km/h".format(self.gps.speed_kmh))
-        if self.gps.track_angle_deg is not None:
-            print("Track angle: {} degrees".format(self.gps.track_angle_deg))
-        if self.gps.horizontal_dilution is not None:
-            print("Horizontal dilution: {}".format(self.gps.horizontal_dilution))
-        if self.gps.height_geoid is not None:
-            print("Height geoid: {} meters".format(self.gps.height_geoid))
+        lines.append(_LAT_FMT.format(self._latitude))
+        lines.append(_LON_FMT.format(self._longitude))
+        lines.append(_PRECISE_LAT_FMT.format(self._latitude_degrees, self._latitude_minutes))
+        lines.append(_PRECISE_LON_FMT.format(self._longitude_degrees, self._longitude_minutes))
+        lines.append(_FIX_QUALITY_FMT.format(self._fix_quality))
+        
+        # Optional attributes if they exist
+        satellites = self._satellites
+        altitude = self._altitude_m
+        speed = self._speed_knots
+        track = self._track_angle_deg
+        hdop = self._horizontal_dilution
+        geoid = self._height_geoid
+        if satellites is not None:
+            lines.append(_SATELLITES_FMT.format(satellites))
+        if altitude is not None:
+            lines.append(_ALTITUDE_FMT.format(altitude))
+        if speed is not None:
+            lines.append(_SPEED_KNOTS_FMT.format(speed))
+            lines.append(_SPEED_KMH_FMT.format(speed * 1.852))
+        if track is not None:
+            lines.append(_TRACK_FMT.format(track))
+        if hdop is not None:
+            lines.append(_HDOP_FMT.format(hdop))
+        if geoid is not None:
+            lines.append(_GEOID_FMT.format(geoid))
+        
+        print("\n".join(lines))
     
     def get_location(self):
         """Get the current location as (latitude, longitude) tuple."""
-        if not self.gps.has_fix:
+        if not self.has_fix:
             return None
-        return (self.gps.latitude, self.gps.longitude)
+        return (self._latitude, self._longitude)
     
     def get_altitude(self):
         """Get the current altitude in meters."""
-        if not self.gps.has_fix or self.gps.altitude_m is None:
+        if not self.has_fix or self._altitude_m is None:
             return None
-        return self.gps.altitude_m
+        return self._altitude_m
 
     def get_timestamp(self):
         """Return the current timestamp from GPS"""
-        if not self.gps.has_fix or self.gps.timestamp_utc is None:
+        timestamp = self.timestamp_utc
+        if not self.has_fix or timestamp is None:
             return None
-        if self.gps.timestamp_utc:
+        if timestamp:
             return(
                 "{}/{}/{} {:02}:{:02}:{:02}".format(
-                    self.gps.timestamp_utc.tm_mon,
-                    self.gps.timestamp_utc.tm_mday,
-                    self.gps.timestamp_utc.tm_year,
-                    self.gps.timestamp_utc.tm_hour,
-                    self.gps.timestamp_utc.tm_min,
-                    self.gps.timestamp_utc.tm_sec,
+                    timestamp.tm_mon,
+                    timestamp.tm_mday,
+                    timestamp.tm_year,
+                    timestamp.tm_hour,
+                    timestamp.tm_min,
+                    timestamp.tm_sec,
                 )
             )
          
@@ -145,22 +467,22 @@ class GPSModule:
         Returns:
             Speed in requested units or None if not available
         """
-        if not self.gps.has_fix:
+        if not self.has_fix:
             return None
             
-        if unit.lower() == 'kmh' and self.gps.speed_kmh is not None:
-            return self.gps.speed_kmh
-        elif unit.lower() == 'knots' and self.gps.speed_knots is not None:
-            return self.gps.speed_knots
+        if unit.lower() == 'kmh' and self._speed_knots is not None:
+            return self._speed_knots * 1.852
+        elif unit.lower() == 'knots' and self._speed_knots is not None:
+            return self._speed_knots
         return None
     
     def get_satellites(self):
         """Get the number of satellites being tracked."""
-        if not self.gps.has_fix or self.gps.satellites is None:
+        if not self.has_fix or self._satellites is None:
             return None
-        return self.gps.satellites
+        return self._satellites
     
     @property
     def has_fix(self):
         """Check if the GPS has a fix."""
-        return self.gps.has_fix
\ No newline at end of file
+        return self._fix_quality >= 1
\ No newline at end of file
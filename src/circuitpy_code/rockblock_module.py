@@ -1,33 +1,89 @@
+import random
+import struct
 import time
 import busio
 import board
 
+# Non-blocking send states (see start_tracking_data / poll)
+IDLE = 0
+LOAD_PENDING = 1  # Loading the modem's MO buffer (AT+SBDWB)
+SBDIX_PENDING = 2
+RETRY_WAIT = 3
+COMPLETE = 4
+
+SBDIX_TIMEOUT_SECONDS = 180
+
+# Longest to wait for the modem to answer "AT" after power-up
+READY_TIMEOUT_SECONDS = 10
+
+# How long a +CSQ answer is reused when the modem isn't sending +CIEV reports
+SIGNAL_CACHE_SECONDS = 30
+
+# Binary payload, 14 bytes little-endian:
+# lat, lon (micro-degrees), altitude (m), satellites, battery (centivolts), temperature (F)
+PAYLOAD_FORMAT = "<iiHBHb"
+
 class SimpleRockBLOCK:
     """Simplified RockBLOCK satellite modem interface for HAB tracking"""
     
     def __init__(self, debug=False):
         self.debug = debug
-        self.uart = busio.UART(board.D1, board.D0, baudrate=19200, timeout=1)
+        # Every read asks for no more than in_waiting, so a short timeout never
+        # stalls; the larger buffer holds a whole response between polls
+        self.uart = busio.UART(board.D1, board.D0, baudrate=19200, timeout=0.05,
+                               receiver_buffer_size=512)
         self.model = None
         self.serial_number = None
         
+        # False when the last response didn't end in OK/ERROR (leftovers may follow)
+        self._response_complete = False
+        
+        # Fields of the last +SBDIX response
+        self.last_sbdix = None
+        
+        # Latest values from unsolicited +CIEV reports (AT+CIER)
+        self._last_signal = None
+        self._signal_at = 0
+        self._cier_enabled = False
+        self.network_available = None  # From +CIEV:1 - None until the first report
+        self._urc_buf = bytearray()
+        
+        # Preallocated binary payload
+        self._payload = bytearray(struct.calcsize(PAYLOAD_FORMAT))
+        
+        # Non-blocking send state
+        self.state = IDLE
+        self.result = (False, None)  # (success, status code) once COMPLETE
+        self._rx = bytearray()
+        self._attempt = 0
+        self._max_attempts = 1
+        self._sbdix_deadline = 0
+        self._sbdix_line_at = None
+        self._retry_at = 0
+        self._load_deadline = 0
+        self._load_written = False
+        
+        # Non-blocking +CSQ check (see start_signal_check / poll_signal)
+        self._csq_pending = False
+        self._csq_deadline = 0
+        
         # Initialize modem
         self._initialize()
     
     def _initialize(self):
         """Initialize modem and get basic info"""
         try:
-            time.sleep(2)  # Let modem settle
-            
-            # Check if modem is responding
-            response = self._send_at_command("")
-            if "OK" in str(response):
+            # Wait for the modem to respond instead of a fixed settle time
+            if self._wait_ready():
                 if self.debug:
                     print("✅ Modem responding")
             
             # Get IMEI (serial number)
             self._get_imei()
             
+            # Report signal/service/antenna changes as +CIEV instead of polling +CSQ
+            self._cier_enabled = "OK" in self._send_at_command("+CIER=1,1,1,1")
+            
             self.model = "RockBLOCK" if self.serial_number else None
             
             if self.debug:
@@ -38,6 +94,15 @@ class SimpleRockBLOCK:
             if self.debug:
                 print(f"Init error: {e}")
     
+    def _wait_ready(self, timeout=READY_TIMEOUT_SECONDS):
+        """Poll with "AT" until the modem answers OK. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if "OK" in self._send_at_command("", timeout=0.5):
+                return True
+            time.sleep(0.25)
+        return False
+    
     def _get_imei(self):
         """Get modem IMEI (serial number)"""
         imei_resp = self._send_at_command("+CGSN")
@@ -47,170 +112,442 @@ class SimpleRockBLOCK:
                 self.serial_number = line
                 break
     
+    def _drain(self, max_time=0.005):
+        """Discard leftover bytes from an unfinished response (keeping any +CIEV reports)"""
+        buf = bytearray()
+        deadline = time.monotonic() + max_time
+        while self.uart.in_waiting and time.monotonic() < deadline:
+            chunk = self.uart.read(self.uart.in_waiting)
+            if chunk:
+                buf.extend(chunk)
+        if buf:
+            self._scan_urcs(self._split_lines(buf))
+    
+    def _split_lines(self, buf):
+        """Split received bytes into non-empty lines (echoed commands end with a bare \\r)"""
+        try:
+            text = str(buf, "utf-8").replace("\r", "\n")
+        except UnicodeError:
+            return []
+        return [line.strip() for line in text.split("\n") if line.strip()]
+    
+    def _scan_urcs(self, lines):
+        """Pick unsolicited +CIEV:<indicator>,<value> reports out of received lines"""
+        for line in lines:
+            if not line.startswith("+CIEV:"):
+                continue
+            try:
+                indicator, value = line[6:].split(",")
+                indicator = int(indicator)
+                value = int(value)
+            except ValueError:
+                continue
+            if indicator == 0:
+                self._last_signal = value
+                self._signal_at = time.monotonic()
+            elif indicator == 1:
+                self.network_available = value == 1
+    
+    def poll_unsolicited(self):
+        """Handle any unsolicited reports already waiting on the UART (non-blocking)
+        
+        Call this every few seconds between sends so +CIEV reports are read
+        before they fill the UART's receive buffer.
+        """
+        if self.busy or self._csq_pending or not self.uart.in_waiting:
+            return
+        chunk = self.uart.read(self.uart.in_waiting)
+        if not chunk:
+            return
+        self._urc_buf.extend(chunk)
+        
+        # Only complete lines - keep a partial report for next time
+        data = bytes(self._urc_buf)
+        end = data.rfind(b"\n")
+        if end < 0:
+            return
+        self._scan_urcs(self._split_lines(data[:end + 1]))
+        self._urc_buf = bytearray(data[end + 1:])
+    
+    def _begin_command(self, command):
+        """Send AT command without waiting - _poll_command collects the response"""
+        if not self._response_complete:
+            self._drain()
+        self._response_complete = False
+        self._rx = bytearray()
+        self.uart.write(f"AT{command}\r".encode())
+    
+    def _poll_command(self, deadline, marker=None):
+        """Collect the response to _begin_command from what the UART already has
+        
+        Returns:
+            Response lines once the final OK/ERROR (or the complete marker line)
+            is in or deadline has passed, None while still waiting
+        """
+        waiting = self.uart.in_waiting
+        if waiting:
+            chunk = self.uart.read(waiting)
+            if chunk:
+                self._rx.extend(chunk)
+        
+        rx = self._rx
+        if b"\r\nOK\r\n" in rx or b"\r\nERROR\r\n" in rx:
+            self._response_complete = True
+        elif marker is not None and marker + b"\r\n" in rx:
+            pass
+        elif time.monotonic() < deadline:
+            return None
+        
+        lines = self._split_lines(rx)
+        self._scan_urcs(lines)
+        return lines
+    
     def _send_at_command(self, command, timeout=10):
-        """Send AT command and return response lines"""
+        """Send AT command and return response lines (blocks until the final OK/ERROR)"""
         try:
-            # Clear any old data
-            self.uart.reset_input_buffer()
-            
-            # Send command
-            full_command = f"AT{command}\r"
-            self.uart.write(full_command.encode())
-            
-            # Read response
-            response = []
-            start_time = time.time()
-            
-            while (time.time() - start_time) < timeout:
-                line = self.uart.readline()
-                if line:
-                    decoded = line.decode().strip()
-                    if decoded:  # Only add non-empty lines
-                        response.append(decoded)
-                        # Stop when we see OK or ERROR
-                        if "OK" in decoded or "ERROR" in decoded:
-                            break
-            
-            return response
-            
+            self._begin_command(command)
+            deadline = time.monotonic() + timeout
+            while True:
+                lines = self._poll_command(deadline)
+                if lines is not None:
+                    return lines
+                time.sleep(0.01)
         except Exception as e:
             return [f"ERROR: {e}"]
     
     def check_signal(self):
-        """Get Iridium signal strength (0-5 bars)"""
+        """Get Iridium signal strength (0-5 bars), blocking until it's known
+        
+        Uses the latest +CIEV report if there is one. Without reports, a +CSQ
+        answer is reused for SIGNAL_CACHE_SECONDS before the modem is asked again.
+        Same as start_signal_check() followed by poll_signal() until it answers.
+        """
+        signal = self.start_signal_check()
+        while signal is None:
+            time.sleep(0.01)
+            signal = self.poll_signal()
+        return signal
+    
+    def _cached_signal(self):
+        """Latest +CIEV report or recent +CSQ answer, or None if the modem has to be asked"""
+        self.poll_unsolicited()
+        if self._last_signal is not None:
+            if self._cier_enabled or time.monotonic() - self._signal_at < SIGNAL_CACHE_SECONDS:
+                return self._last_signal
+        return None
+    
+    def _parse_csq(self, response):
+        """Signal bars from +CSQ response lines (0 if there isn't one)"""
+        # Look for signal strength line
+        for line in response:
+            if "+CSQ:" in line:
+                try:
+                    # Extract number after the colon
+                    signal_str = line.split(":")[1].strip()
+                    signal = int(signal_str)
+                    self._last_signal = signal
+                    self._signal_at = time.monotonic()
+                    return signal
+                except (ValueError, IndexError):
+                    continue
+        
+        # No signal found
+        if self.debug:
+            print("No signal response found")
+        return 0
+    
+    def start_signal_check(self):
+        """Non-blocking check_signal - call poll_signal() until it returns a value
+        
+        Returns:
+            Signal bars if a +CIEV report or cached +CSQ answer can be used,
+            otherwise None once AT+CSQ has been sent
+        """
+        signal = self._cached_signal()
+        if signal is not None:
+            return signal
+        
         try:
-            response = self._send_at_command("+CSQ", timeout=5)
-            
-            if self.debug:
-                print(f"Signal check response: {response}")
-            
-            # Look for signal strength line
-            for line in response:
-                if "+CSQ:" in line:
-                    try:
-                        # Extract number after the colon
-                        signal_str = line.split(":")[1].strip()
-                        signal = int(signal_str)
-                        return signal
-                    except (ValueError, IndexError):
-                        continue
-            
-            # No signal found
-            if self.debug:
-                print("No signal response found")
-            return 0
-            
+            self._begin_command("+CSQ")
         except Exception as e:
             if self.debug:
                 print(f"Signal check error: {e}")
             return 0
+        self._csq_deadline = time.monotonic() + 5
+        self._csq_pending = True
+        return None
     
-    def send_tracking_data_with_retry(self, lat, lon, altitude, satellites, battery, temperature, max_attempts=3):
-        """Send tracking data with automatic retry"""
+    def poll_signal(self):
+        """Advance a check started by start_signal_check. Only reads what the UART already has.
         
-        # Format message: lat|lon|altitude|satellites|battery|temperature
-        message = f"{lat:.4f}|{lon:.4f}|{altitude or 0}|{satellites}|{battery or 0:.1f}|{temperature or 0:.0f}"
+        Returns:
+            Signal bars once the +CSQ answer is in (0 on timeout), None otherwise
+        """
+        if not self._csq_pending:
+            return self._cached_signal()
         
-        if self.debug:
-            print(f"📡 Sending: {message}")
+        lines = self._poll_command(self._csq_deadline)
+        if lines is None:
+            return None
+        self._csq_pending = False
         
-        # First, set the message to send
-        if not self._set_message(message):
-            return False, None
+        if self.debug:
+            print(f"Signal check response: {lines}")
+        return self._parse_csq(lines)
+    
+    def _pack_message(self, lat, lon, altitude, satellites, battery, temperature):
+        """Pack tracking data into the 14-byte binary payload (see PAYLOAD_FORMAT)"""
+        struct.pack_into(
+            PAYLOAD_FORMAT, self._payload, 0,
+            round(lat * 1000000), round(lon * 1000000),
+            min(max(int(altitude or 0), 0), 65535),
+            min(satellites or 0, 255),
+            min(round((battery or 0) * 100), 65535),
+            min(max(int(temperature or 0), -128), 127)
+        )
+        return self._payload
+    
+    def _check_status(self, status_code, attempt, max_attempts):
+        """Decide what to do with an +SBDIX MO status
         
-        # Try to send with retries
-        for attempt in range(max_attempts):
-            if self.debug:
-                print(f"📡 Send attempt {attempt + 1}/{max_attempts}")
-            
-            status_code = self._send_message()
+        Returns:
+            'sent', 'stop' (give up) or 'retry'
+        """
+        if status_code is not None:
+            # Success codes: 0-5 = sent, 6-8 = queued
+            if status_code <= 8:
+                if self.debug:
+                    print("✅ Message sent successfully!")
+                return 'sent'
             
-            if status_code is not None:
-                # Success codes: 0-5 = sent, 6-8 = queued
-                if status_code <= 8:
-                    if self.debug:
-                        print("✅ Message sent successfully!")
-                    return True, status_code
+            # Handle specific errors
+            elif status_code == 32:
+                # Network unavailable - retry after delay
+                if self.debug:
+                    print("⚠️ Network unavailable - will retry")
+                
+            elif status_code in [13, 14, 15]:
+                # Account/credit error - stop trying
+                if self.debug:
+                    print(f"❌ Account/credit error ({status_code})")
+                return 'stop'
                 
-                # Handle specific errors
-                elif status_code == 32:
-                    # Network unavailable - retry after delay
-                    if self.debug:
-                        print("⚠️ Network unavailable - will retry")
-                    if attempt < max_attempts - 1:
-                        time.sleep(30)
-                    
-                elif status_code in [13, 14, 15]:
-                    # Account/credit error - stop trying
-                    if self.debug:
-                        print(f"❌ Account/credit error ({status_code})")
-                    return False, status_code
-                    
-                else:
-                    # Other error - retry after short delay
-                    if self.debug:
-                        print(f"⚠️ Error {status_code} - will retry")
-                    if attempt < max_attempts - 1:
-                        time.sleep(15)
             else:
-                # No response - retry after short delay
+                # Other error - retry after short delay
                 if self.debug:
-                    print("❌ No response received")
-                if attempt < max_attempts - 1:
-                    time.sleep(10)
+                    print(f"⚠️ Error {status_code} - will retry")
+        else:
+            # No response - retry after short delay
+            if self.debug:
+                print("❌ No response received")
+        
+        if attempt < max_attempts - 1:
+            return 'retry'
         
         # All attempts failed
         if self.debug:
             print(f"❌ All {max_attempts} attempts failed")
-        return False, None
+        return 'stop'
+    
+    def send_tracking_data_with_retry(self, lat, lon, altitude, satellites, battery, temperature, max_attempts=3):
+        """Send tracking data with automatic retry (blocks until done)
+        
+        Returns:
+            (success, MO status code or None)
+        """
+        if not self.start_tracking_data(lat, lon, altitude, satellites, battery, temperature,
+                                        max_attempts=max_attempts):
+            self.finish()
+            return False, None
+        while not self.poll():
+            time.sleep(0.05)
+        return self.finish()
     
-    def _set_message(self, message):
-        """Set message in modem buffer"""
+    def start_tracking_data(self, lat, lon, altitude, satellites, battery, temperature, max_attempts=3):
+        """Start sending tracking data without blocking - call poll() until it returns True
+        
+        Returns:
+            True if the send was started, False if the modem couldn't be written to
+        """
+        message = self._pack_message(lat, lon, altitude, satellites, battery, temperature)
+        
+        if self.debug:
+            print(f"📡 Sending {len(message)} bytes: {lat:.4f},{lon:.4f} alt:{altitude}")
+        
+        self._attempt = 0
+        self._max_attempts = max_attempts
+        
+        # Ask for the binary buffer - poll() writes the payload once the modem says READY
         try:
-            command = f'+SBDWT="{message}"'
-            response = self._send_at_command(command)
-            
-            if "OK" in str(response):
-                return True
-            else:
-                if self.debug:
-                    print("❌ Failed to set message")
-                return False
-                
+            self._begin_command(f"+SBDWB={len(message)}")
         except Exception as e:
             if self.debug:
                 print(f"❌ Set message error: {e}")
+            self.result = (False, None)
+            self.state = COMPLETE
+            return False
+        self._load_deadline = time.monotonic() + 5
+        self._load_written = False
+        self.state = LOAD_PENDING
+        return True
+    
+    def _poll_load(self, now):
+        """LOAD_PENDING step of poll(): write the payload after READY, then start
+        the satellite session once the modem has accepted it"""
+        lines = self._poll_command(self._load_deadline, None if self._load_written else b"READY")
+        if lines is None:
+            return False
+        
+        if not self._load_written:
+            if "READY" not in lines:
+                if self.debug:
+                    print("❌ Modem not ready for message")
+                return self._load_failed()
+            
+            # Payload followed by the 2-byte sum of all payload bytes, big-endian
+            payload = self._payload
+            checksum = sum(payload) & 0xFFFF
+            self._rx = bytearray()
+            self._response_complete = False
+            self.uart.write(payload)
+            self.uart.write(bytes((checksum >> 8, checksum & 0xFF)))
+            self._load_deadline = now + 5
+            self._load_written = True
+            return False
+        
+        # 0 = loaded OK, 1 = timeout, 2 = bad checksum, 3 = bad size
+        if "0" in lines and "OK" in lines:
+            self._start_sbdix()
             return False
+        if self.debug:
+            print(f"❌ Failed to set message: {lines}")
+        return self._load_failed()
+    
+    def _load_failed(self):
+        """Finish a non-blocking send whose message couldn't be loaded"""
+        self.result = (False, None)
+        self.state = COMPLETE
+        return True
+    
+    @property
+    def busy(self):
+        """True while a non-blocking send is in progress"""
+        return self.state in (LOAD_PENDING, SBDIX_PENDING, RETRY_WAIT)
+    
+    def _start_sbdix(self):
+        """Kick off one satellite session and return straight away"""
+        if self.debug:
+            print(f"📡 Send attempt {self._attempt + 1}/{self._max_attempts}")
+        self._sbdix_line_at = None
+        self._begin_command("+SBDIX")
+        self._sbdix_deadline = time.monotonic() + SBDIX_TIMEOUT_SECONDS
+        self.state = SBDIX_PENDING
+    
+    def poll(self):
+        """Advance a non-blocking send. Only reads what the UART already has.
+        
+        Returns:
+            True once the send has finished (see self.result), False otherwise
+        """
+        if self.state == COMPLETE:
+            return True
+        if not self.busy:
+            return False
+        
+        now = time.monotonic()
+        
+        if self.state == RETRY_WAIT:
+            if now >= self._retry_at:
+                self._attempt += 1
+                self._start_sbdix()
+            return False
+        
+        if self.state == LOAD_PENDING:
+            return self._poll_load(now)
+        
+        # SBDIX_PENDING - pick up whatever has arrived
+        waiting = self.uart.in_waiting
+        if waiting:
+            chunk = self.uart.read(waiting)
+            if chunk:
+                self._rx.extend(chunk)
+        
+        rx = self._rx
+        status_code = None
+        finished = False
+        if b"\r\nOK\r\n" in rx or b"\r\nERROR\r\n" in rx:
+            self._response_complete = True
+            finished = True
+        elif b"+SBDIX:" in rx:
+            rest = bytes(rx)
+            if b"\r\n" in rest[rest.find(b"+SBDIX:"):]:
+                # Status line is in - give the trailing OK a moment before moving on
+                if self._sbdix_line_at is None:
+                    self._sbdix_line_at = now
+                finished = now - self._sbdix_line_at >= 0.5
+        if not finished and now >= self._sbdix_deadline:
+            finished = True
+        if not finished:
+            return False
+        
+        lines = self._split_lines(rx)
+        self._scan_urcs(lines)
+        for line in lines:
+            if "+SBDIX:" in line:
+                status_code = self._parse_sbdix(line)
+                if status_code is not None:
+                    break
+        
+        action = self._check_status(status_code, self._attempt, self._max_attempts)
+        if action == 'retry':
+            self._retry_at = now + self._backoff(self._attempt)
+            self.state = RETRY_WAIT
+            return False
+        
+        self.result = (action == 'sent', status_code)
+        self.state = COMPLETE
+        return True
+    
+    def finish(self):
+        """Collect the result of a completed non-blocking send and go back to IDLE"""
+        result = self.result
+        self.state = IDLE
+        return result
+    
+    def _backoff(self, attempt, base=5, cap=120):
+        """Seconds to wait before the next attempt - doubles each time, plus jitter"""
+        delay = min(cap, base * (1 << attempt)) + random.uniform(0, base)
+        if self.debug:
+            print(f"⏳ Retrying in {delay:.0f}s")
+        return delay
     
-    def _send_message(self):
-        """Send message via satellite"""
+    def _parse_sbdix(self, line):
+        """Parse an +SBDIX line into self.last_sbdix and return the MO status (None if invalid)"""
         try:
-            # Send command (long timeout for satellite connection)
-            response = self._send_at_command("+SBDIX", timeout=180)
+            # +SBDIX: <MO status>, <MOMSN>, <MT status>, <MTMSN>, <MT length>, <MT queued>
+            status_part = line.split(":")[1].strip()
+            fields = [int(field) for field in status_part.split(",")]
+            status_code = fields[0]
+            self.last_sbdix = fields
             
-            # Parse response
-            for line in response:
-                if "+SBDIX:" in line:
-                    try:
-                        # Extract status codes
-                        status_part = line.split(":")[1].strip()
-                        status_codes = status_part.split(",")
-                        status_code = int(status_codes[0])
-                        
-                        if self.debug:
-                            print(f"Status code: {status_code}")
-                        
-                        return status_code
-                        
-                    except (ValueError, IndexError) as e:
-                        if self.debug:
-                            print(f"Parse error: {e}")
-                        continue
+            if self.debug:
+                print(f"Status code: {status_code}")
+                if len(fields) >= 6:
+                    print(f"MOMSN: {fields[1]}, MT status: {fields[2]}, MTMSN: {fields[3]}, "
+                          f"MT length: {fields[4]}, MT queued: {fields[5]}")
             
-            # No valid response found
-            return None
+            return status_code
             
-        except Exception as e:
+        except (ValueError, IndexError) as e:
             if self.debug:
-                print(f"❌ Send error: {e}")
-            return None
\ No newline at end of file
+                print(f"Parse error: {e}")
+            return None
+    
+    @property
+    def mt_message_waiting(self):
+        """True if the last session received or reported a queued mobile-terminated message"""
+        fields = self.last_sbdix
+        if not fields or len(fields) < 6:
+            return False
+        # MT status 1 = message received, MT queued = messages still waiting at the gateway
+        return fields[2] == 1 or fields[5] > 0
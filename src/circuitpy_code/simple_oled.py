@@ -2,47 +2,265 @@
 # Just import this and use it!
 
 import board
+import busio
 import displayio
 import terminalio
-from adafruit_display_text import label
+import bitmaptools
 from i2cdisplaybus import I2CDisplayBus
 import adafruit_displayio_ssd1306
 
+# Every character the tracker screens use
+GLYPHS = "0123456789.,:-+/%°# ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz!"
+
 class SimpleOLED:
-    def __init__(self):
-        """Initialize a simple OLED display - just create and use!"""
+    # 128x32 display - use SimpleOLED64 if you have a taller display
+    WIDTH = 128
+    HEIGHT = 32
+    
+    # Lines that fit, and the top pixel row of each line's glyphs (lines are 10 pixels apart)
+    MAX_LINES = 3
+    _Y_OFFSETS = (0, 10, 20)
+    
+    # The display already set up, handed back instead of resetting it again
+    _instance = None
+    
+    def __new__(cls, i2c=None):
+        instance = SimpleOLED._instance
+        if instance is not None and type(instance) is cls:
+            return instance
+        instance = super().__new__(cls)
+        instance._ready = False
+        SimpleOLED._instance = instance
+        return instance
+    
+    def __init__(self, i2c=None):
+        """Initialize a simple OLED display - just create and use!
+        
+        Creating it again returns the same display, already set up (the i2c
+        argument is ignored then), rather than releasing and resetting it.
+        
+        Args:
+            i2c: Existing I2C bus to share (optional - if None, a bus is made at
+                 1 MHz, which needs good pull-ups and short wires, or 400 kHz
+                 if the board won't do that)
+        """
+        if self._ready:
+            return
+        
         # Release any existing displays
         displayio.release_displays()
         
         # Set up the display - these are the settings that work on your hardware
-        i2c = board.I2C()
+        if i2c is None:
+            i2c = self._make_i2c()
         reset_pin = board.D9
         display_bus = I2CDisplayBus(i2c, device_address=0x3D, reset=reset_pin)
         
-        # 128x32 display (change to 64 if you have a taller display)
-        self.width = 128
-        self.height = 32
+        self.width = self.WIDTH
+        self.height = self.HEIGHT
         
         # Create the display
-        display = adafruit_displayio_ssd1306.SSD1306(
+        self.display = adafruit_displayio_ssd1306.SSD1306(
             display_bus, width=self.width, height=self.height
         )
         
+        # All text is drawn straight into one bitmap shown by a single TileGrid,
+        # instead of a Label (with its own TileGrid and palette) per line
+        self._fb = displayio.Bitmap(self.width, self.height, 2)
+        palette = displayio.Palette(2)
+        palette[0] = 0x000000
+        palette[1] = 0xFFFFFF  # White
+        
         # Create a display group to hold everything
         self.group = displayio.Group()
-        display.root_group = self.group
+        self.group.append(displayio.TileGrid(self._fb, pixel_shader=palette))
+        self.display.root_group = self.group
+        
+        # Nesting depth of begin_frame()/end_frame() pairs, and the
+        # auto_refresh setting to put back when the outermost one ends
+        self._frame_depth = 0
+        self._auto_refresh = True
+        
+        # Whether any line changed since the last refresh
+        self._dirty = False
+        
+        # Lines (bit per line) cleared inside a frame and not drawn again yet
+        self._pending_clear = 0
+        
+        # Character codes each line shows, in one preallocated buffer per line,
+        # and how many are in use (-1 if the line was never used) - kept so
+        # only characters that change are drawn again. preload_glyphs() sizes
+        # the buffers to the font.
+        self._max_lines = self.MAX_LINES
+        self._lengths = None
+        
+        # Monospaced font for all text - swap in a loaded BDF font if you like
+        self.font = terminalio.FONT
+        self.preload_glyphs()
         
         # Start with a blank display
         self.clear()
         
         # Keep track of how many lines we've added
         self.line_count = 0
+        self._ready = True
+        
+    @staticmethod
+    def _make_i2c():
+        """Open the I2C bus as fast as the board allows"""
+        for frequency in (1_000_000, 400_000):
+            try:
+                return busio.I2C(board.SCL, board.SDA, frequency=frequency)
+            except (ValueError, RuntimeError):
+                pass
+        return board.I2C()
+    
+    def preload_glyphs(self, charset=GLYPHS):
+        """Load the glyphs for charset now, not the first time each one is drawn
+        
+        The built-in terminalio font has every glyph already, so loading only
+        happens for fonts from adafruit_bitmap_font. Call it again after
+        changing self.font so its character cell size is picked up too - the
+        screen is blanked then, since the old text no longer lines up with
+        the new cells, so draw the lines again afterwards.
+        """
+        if hasattr(self.font, "load_glyphs"):
+            self.font.load_glyphs(charset)
+        box = self.font.get_bounding_box()
+        self._cell_width = box[0]
+        self._cell_height = box[1]
+        self._columns = self.width // self._cell_width
+        
+        # Line buffers sized to the columns this font fits
+        lengths = self._lengths
+        self._lines = [bytearray(self._columns) for _ in range(self._max_lines)]
+        self._scratch = bytearray(self._columns)
+        if lengths is None:
+            self._lengths = [-1] * self._max_lines
+        else:
+            # Font changed - blank the old text, lines in use stay usable
+            self._lengths = [min(length, 0) for length in lengths]
+            self._pending_clear = 0
+            bitmaptools.fill_region(self._fb, 0, 0, self.width, self.height, 0)
+            self._dirty = True
+        
+        # Where each character's glyph sits in the font, by code (None = not
+        # looked up yet) - filled for charset now, anything else on first use
+        self._tiles = [None] * 256
+        for char in charset:
+            code = ord(char)
+            if code < 256:
+                self._tile(code)
+    
+    def _tile(self, code):
+        """Look up and remember (bitmap, x1, y1, x2, y2) for a glyph, or False if the font lacks it"""
+        glyph = self.font.get_glyph(code)
+        if glyph is None:
+            tile = False
+        else:
+            # Glyphs are tiles in the font's bitmap, tile_index counting across the rows
+            source = glyph.bitmap
+            width = glyph.width
+            height = glyph.height
+            per_row = source.width // width
+            x1 = (glyph.tile_index % per_row) * width
+            y1 = (glyph.tile_index // per_row) * height
+            tile = (source, x1, y1, x1 + width, y1 + height)
+        self._tiles[code] = tile
+        return tile
+    
+    def begin_frame(self):
+        """Start a frame - changes are held back until end_frame()"""
+        if self._frame_depth == 0:
+            self._auto_refresh = self.display.auto_refresh
+            self.display.auto_refresh = False
+        self._frame_depth += 1
+    
+    def end_frame(self):
+        """Finish a frame and push everything to the screen in one refresh"""
+        if self._frame_depth == 0:
+            return
+        self._frame_depth -= 1
+        if self._frame_depth == 0:
+            self._apply_pending_clear()
+            
+            # Nothing changed - don't send a frame to the display at all.
+            # Otherwise displayio only sends the changed area of the bitmap;
+            # minimum_frames_per_second=0 so the refresh is never skipped as "too late"
+            if self._dirty:
+                self._dirty = False
+                self.display.refresh(minimum_frames_per_second=0)
+            self.display.auto_refresh = self._auto_refresh
+    
+    def flush_async(self):
+        """Finish the frame but leave sending it to displayio's background refresh
+        
+        Returns straight away instead of waiting for the I2C transfer: with
+        auto_refresh on, displayio sends the changed area while the program
+        sleeps (time.sleep or an asyncio sleep), so the transfer overlaps the
+        loop's idle time. If auto_refresh was off before the frame it stays
+        off, and the frame is sent with a normal refresh instead. Ends any
+        nested frames too.
+        """
+        if self._frame_depth == 0:
+            return
+        self._frame_depth = 0
+        self._apply_pending_clear()
+        if self._dirty:
+            self._dirty = False
+            if not self._auto_refresh:
+                self.display.refresh(minimum_frames_per_second=0)
+        self.display.auto_refresh = self._auto_refresh
+    
+    def _apply_pending_clear(self):
+        """Blank the lines that were cleared in a frame and not given new text"""
+        pending = self._pending_clear
+        if pending:
+            for line in range(self._max_lines):
+                if pending & (1 << line):
+                    self._set_codes(line, self._scratch, 0)
+    
+    def frame(self):
+        """Group several changes into one screen refresh
         
+        Usage:
+            with oled.frame():
+                oled.clear()
+                oled.add_text("Line 1")
+                oled.add_text("Line 2")
+        """
+        return self
+    
+    def batch(self):
+        """Same as frame() - wrap a block of line updates so they refresh once"""
+        return self
+    
+    def __enter__(self):
+        self.begin_frame()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_frame()
+    
     def clear(self):
         """Clear everything from the display"""
-        # Remove all items from the display group
-        while len(self.group) > 0:
-            self.group.pop()
+        lengths = self._lengths
+        if self._frame_depth:
+            # Inside a frame, only lines that aren't drawn again before it ends
+            # get blanked - so clear() then the same text again draws nothing
+            for line in range(len(lengths)):
+                if lengths[line] > 0:
+                    self._pending_clear |= 1 << line
+        else:
+            # Blank the whole bitmap in one call if anything is showing
+            drawn = False
+            for line in range(len(lengths)):
+                if lengths[line] > 0:
+                    lengths[line] = 0
+                    drawn = True
+            if drawn:
+                bitmaptools.fill_region(self._fb, 0, 0, self.width, self.height, 0)
+                self._dirty = True
         
         # Reset line counter
         self.line_count = 0
@@ -52,44 +270,131 @@ class SimpleOLED:
         
         Args:
             text: The text to display
-            line: Which line to put it on (0-3 for small display)
+            line: Which line to put it on (0 to MAX_LINES - 1)
                  If None, adds to the next available line
+        
+        Returns:
+            The line number, or None if the line won't fit on the display
         """
         # If line is not specified, use the next available line
         if line is None:
             line = self.line_count
             self.line_count += 1
         
-        # Limit to what fits on the display
-        max_lines = self.height // 10
-        if line >= max_lines:
-            print(f"Warning: Line {line} won't fit on display")
-            return
-        
-        # Position text on the requested line (each line is about 10 pixels tall)
-        y_position = 10 * line + 6
+        # Limit to what fits on the display - quietly, since printing over USB
+        # can stall the update if the host isn't reading
+        if not 0 <= line < self._max_lines:
+            return None
         
-        # Create a text label
-        text_label = label.Label(
-            terminalio.FONT,
-            text=text,
-            color=0xFFFFFF,  # White
-            x=0,
-            y=y_position
-        )
+        # Draw it on the requested line
+        self._set_text(line, text)
         
-        # Add it to our display group
-        self.group.append(text_label)
+        # Return the line number, which stays valid across clear()
+        return line
+    
+    def set_lines(self, texts):
+        """Set several lines in one call and one refresh
         
-        # Return the index of this text in the group
-        return len(self.group) - 1
+        Args:
+            texts: List of strings for lines 0, 1, ... (any other lines are
+                   blanked), or a dict of {line: text} to change just those lines
+        """
+        with self.frame():
+            if isinstance(texts, dict):
+                for line, text in texts.items():
+                    self.add_text(text, line)
+            else:
+                self.clear()
+                for line, text in enumerate(texts):
+                    self.add_text(text, line)
+                self.line_count = len(texts)
     
     def update_text(self, text, index):
         """Update text at a specific position
         
         Args:
             text: New text to display
-            index: Index returned from add_text
+            index: Line number returned from add_text
         """
-        if 0 <= index < len(self.group):
-            self.group[index].text = text
\ No newline at end of file
+        if 0 <= index < self._max_lines and self._lengths[index] >= 0:
+            self._set_text(index, text)
+    
+    def set_line_bytes(self, line, data):
+        """Show character codes on a line without making a string
+        
+        For readouts that change often: format into a reused bytearray (ASCII or
+        Latin-1 codes, e.g. with struct.pack_into) and pass it, or a memoryview
+        slice of it, here.
+        
+        Args:
+            line: Which line to put it on
+            data: bytes, bytearray or memoryview of character codes
+        """
+        if 0 <= line < self._max_lines:
+            self._set_codes(line, data, len(data))
+    
+    def _set_text(self, line, text):
+        """Show a string on a line, via the scratch buffer"""
+        scratch = self._scratch
+        count = min(len(text), len(scratch))
+        for i in range(count):
+            code = ord(text[i])
+            scratch[i] = code if code < 256 else 0x3F  # "?" for anything past Latin-1
+        self._set_codes(line, scratch, count)
+    
+    def _set_codes(self, line, data, count):
+        """Change a line to the first count codes of data, redrawing only the
+        character cells that differ
+        
+        Keeping the change to those cells keeps displayio's dirty area, and so
+        the bytes sent to the panel, to the part of the line that changed.
+        """
+        fb = self._fb
+        lines = self._lines
+        lengths = self._lengths
+        current = lines[line]
+        count = min(count, len(current))
+        self._pending_clear &= ~(1 << line)
+        old_count = lengths[line]
+        lengths[line] = count
+        
+        width = self._cell_width
+        top = self._Y_OFFSETS[line]
+        bottom = min(top + self._cell_height, self.height)
+        first = max(line - 1, 0)
+        last = min(line + 1, self._max_lines - 1)
+        
+        for col in range(max(count, old_count)):
+            new = data[col] if col < count else -1
+            old = current[col] if col < old_count else -1
+            if new == old:
+                continue
+            if col < count:
+                current[col] = new
+            
+            # Glyphs are taller than the line spacing, so blank the cell's whole
+            # glyph band and redraw the characters above and below that overlap it
+            x = col * width
+            bitmaptools.fill_region(fb, x, top, x + width, bottom, 0)
+            for n in range(first, last + 1):
+                if col < lengths[n]:
+                    self._blit_char(n, col, lines[n][col])
+            self._dirty = True
+    
+    def _blit_char(self, line, col, code):
+        """Copy one character's glyph into its cell, leaving the background untouched"""
+        tile = self._tiles[code]
+        if tile is None:
+            tile = self._tile(code)
+        if not tile:
+            return
+        source, x1, y1, x2, y2 = tile
+        bitmaptools.blit(self._fb, source, col * self._cell_width, self._Y_OFFSETS[line],
+                         x1=x1, y1=y1, x2=x2, y2=y2, skip_source_index=0)
+
+
+class SimpleOLED64(SimpleOLED):
+    """SimpleOLED for a 128x64 display"""
+    HEIGHT = 64
+    MAX_LINES = 6
+    _Y_OFFSETS = (0, 10, 20, 30, 40, 50)
@@ -3,15 +3,52 @@
 Download and parse RockBLOCK messages from Google Cloud Storage
 """
 
-import json
 import os
-from datetime import datetime
-from google.cloud import storage
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# orjson parses much faster if it's installed; the standard library works the same way
+try:
+    import orjson as json
+except ImportError:
+    import json
 
 # Configuration
 BUCKET_NAME = "hab-tracker-424242"
 YOUR_IMEI = "301434061666900"  # Your RockBLOCK IMEI
 
+# Binary payload sent by the tracker (see rockblock_module.PAYLOAD_FORMAT):
+# lat, lon (micro-degrees), altitude (m), satellites, battery (centivolts), temperature (F)
+PAYLOAD_FORMAT = "<iiHBHb"
+PAYLOAD_SIZE = struct.calcsize(PAYLOAD_FORMAT)
+
+# Older text messages: lat|lon|altitude|satellites|battery|temp
+TEXT_MESSAGE_PATTERN = re.compile(r'^([-\d.]+)\|([-\d.]+)\|(-?\d+)\|(\d+)\|([-\d.]+)\|(-?\d+)$')
+
+# Sort key for blobs without a creation time - GCS times are timezone-aware,
+# so a naive datetime.min can't be compared with them
+_NO_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+# Parallel blob downloads - each one is a separate HTTPS round trip
+DOWNLOAD_WORKERS = 16
+
+def _fetch_message(blob):
+    """Download one blob and parse its JSON, or None if it can't be read"""
+    try:
+        content = blob.download_as_text()
+        message_data = json.loads(content)
+        
+        # Add blob name and creation time for reference
+        message_data['blob_name'] = blob.name
+        message_data['blob_created'] = blob.time_created.isoformat() if blob.time_created else None
+        return message_data
+        
+    except Exception as e:
+        print(f"⚠️  Error parsing {blob.name}: {e}")
+        return None
+
 def download_messages(bucket_name, imei_filter=None, limit=10):
     """
     Download recent messages from Google Cloud Storage bucket
@@ -21,6 +58,9 @@ def download_messages(bucket_name, imei_filter=None, limit=10):
         imei_filter: Only show messages from this IMEI (optional)
         limit: Maximum number of messages to show
     """
+    # Imported here - the client library takes seconds to load
+    from google.cloud import storage
+    
     try:
         # Initialize storage client
         storage_client = storage.Client()
@@ -28,37 +68,19 @@ def download_messages(bucket_name, imei_filter=None, limit=10):
         
         print(f"🔍 Searching bucket '{bucket_name}' for messages...")
         
-        # List all blobs (files) in the bucket
-        blobs = bucket.list_blobs()
+        # List blobs (files) in the bucket - GCS filters by IMEI prefix server-side
+        blobs = list(bucket.list_blobs(prefix=imei_filter or None))
         
-        messages = []
-        
-        for blob in blobs:
-            # Skip if filtering by IMEI and this doesn't match
-            if imei_filter and not blob.name.startswith(imei_filter):
-                continue
-                
-            try:
-                # Download and parse the JSON file
-                content = blob.download_as_text()
-                message_data = json.loads(content)
-                
-                # Add blob name and creation time for reference
-                message_data['blob_name'] = blob.name
-                message_data['blob_created'] = blob.time_created.isoformat() if blob.time_created else None
-                
-                messages.append(message_data)
-                
-            except Exception as e:
-                print(f"⚠️  Error parsing {blob.name}: {e}")
-                continue
-        
-        # Sort by timestamp (newest first)
-        messages.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-        # Limit results
+        # Only download the newest ones - listing order is by name, so sort on creation time
+        blobs.sort(key=lambda blob: blob.time_created or _NO_TIME, reverse=True)
         if limit:
-            messages = messages[:limit]
+            blobs = blobs[:limit]
+        
+        # Download and parse the JSON files in parallel - map() keeps the
+        # blobs' newest-first order, so no sort is needed afterwards
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            results = executor.map(_fetch_message, blobs)
+            messages = [message for message in results if message is not None]
         
         return messages
         
@@ -70,28 +92,61 @@ def download_messages(bucket_name, imei_filter=None, limit=10):
 
 def parse_tracking_message(message):
     """
-    Parse the pipe-delimited tracking message
-    Format: lat|lon|altitude|satellites|battery|temp
+    Parse a tracking message - either the hex-encoded binary payload
+    or the older pipe-delimited text format: lat|lon|altitude|satellites|battery|temp
     """
     try:
         # Remove any surrounding quotes that might be present
         clean_message = message.strip().strip('"\'')
         
-        parts = clean_message.split('|')
-        if len(parts) == 6:
+        # Binary payload arrives hex-encoded (RockBLOCK 'data' field)
+        if len(clean_message) == PAYLOAD_SIZE * 2:
+            try:
+                payload = bytes.fromhex(clean_message)
+            except ValueError:
+                payload = None
+            if payload:
+                lat, lon, altitude, satellites, battery, temperature = struct.unpack(PAYLOAD_FORMAT, payload)
+                return {
+                    'latitude': lat / 1000000,
+                    'longitude': lon / 1000000,
+                    'altitude': altitude,
+                    'satellites': satellites,
+                    'battery': battery / 100,
+                    'temperature': temperature
+                }
+        
+        match = TEXT_MESSAGE_PATTERN.match(clean_message)
+        if match:
+            lat, lon, altitude, satellites, battery, temperature = match.groups()
             return {
-                'latitude': float(parts[0]),
-                'longitude': float(parts[1]),
-                'altitude': int(parts[2]),
-                'satellites': int(parts[3]),
-                'battery': float(parts[4]),
-                'temperature': int(parts[5])
+                'latitude': float(lat),
+                'longitude': float(lon),
+                'altitude': int(altitude),
+                'satellites': int(satellites),
+                'battery': float(battery),
+                'temperature': int(temperature)
             }
         else:
-            return {'raw_message': clean_message, 'parsed': False, 'parts_found': len(parts)}
+            return {'raw_message': clean_message, 'parsed': False, 'parts_found': clean_message.count('|') + 1}
     except Exception as e:
         return {'raw_message': message, 'error': str(e)}
 
+def _tracking_payload(msg):
+    """
+    Pick the field to parse from a stored message: the raw hex 'data' when it
+    holds a binary payload (a decoded 'message' of binary bytes is mangled),
+    otherwise the text 'message' of older messages
+    """
+    data = (msg.get('data') or '').strip()
+    if len(data) == PAYLOAD_SIZE * 2:
+        try:
+            bytes.fromhex(data)
+            return data
+        except ValueError:
+            pass
+    return msg.get('message') or data
+
 def display_messages(messages):
     """Display messages in a nice format"""
     
@@ -109,7 +164,7 @@ def display_messages(messages):
         print(f"   File: {msg.get('blob_name', 'Unknown')}")
         
         # Parse the tracking data
-        raw_message = msg.get('message', '')
+        raw_message = _tracking_payload(msg)
         parsed = parse_tracking_message(raw_message)
         
         print(f"   Raw Message: {raw_message}")